@@ -49,6 +49,7 @@ CLI Example:
 """
 import base64
 import errno
+import hashlib
 import logging
 import os.path
 import signal
@@ -59,6 +60,7 @@ from contextlib import contextmanager
 
 import salt.utils.files
 import salt.utils.platform
+import salt.utils.stringutils
 import salt.utils.templates
 import salt.utils.yaml
 from salt.exceptions import CommandExecutionError
@@ -111,6 +113,19 @@ if not salt.utils.platform.is_windows():
     POLLING_TIME_LIMIT = 30
 
 
+# The API client for the most recently loaded kubeconfig and context. Reusing it
+# keeps its connection pool, so consecutive calls avoid a new TLS handshake.
+_API_CLIENT = {}
+
+
+def _api_client():
+    """
+    Return the API client cached by _setup_conn or None, which makes the
+    kubernetes library create a new one
+    """
+    return _API_CLIENT.get("client")
+
+
 def _setup_conn(**kwargs):
     """
     Setup kubernetes API connection singleton
@@ -121,10 +136,14 @@ def _setup_conn(**kwargs):
     )
     context = kwargs.get("context") or __salt__["config.option"]("kubernetes.context")
 
+    cache_key = None
     if (kubeconfig_data and not kubeconfig) or (kubeconfig_data and kwargs.get("kubeconfig_data")):
         with tempfile.NamedTemporaryFile(prefix="salt-kubeconfig-", delete=False) as kcfg:
             kcfg.write(base64.b64decode(kubeconfig_data))
             kubeconfig = kcfg.name
+        # The temporary file is new on every call, key the client on its contents
+        data_hash = hashlib.sha256(salt.utils.stringutils.to_bytes(kubeconfig_data)).hexdigest()
+        cache_key = ("kubeconfig_data", data_hash, context)
 
     if not (kubeconfig and context):
         raise CommandExecutionError(
@@ -132,7 +151,17 @@ def _setup_conn(**kwargs):
             " are required."
         )
 
-    kubernetes.config.load_kube_config(config_file=kubeconfig, context=context)
+    if cache_key is None:
+        try:
+            cache_key = (kubeconfig, context, os.path.getmtime(kubeconfig))
+        except OSError:
+            pass
+
+    if cache_key is None or _API_CLIENT.get("key") != cache_key:
+        _API_CLIENT.clear()
+        kubernetes.config.load_kube_config(config_file=kubeconfig, context=context)
+        if cache_key is not None:
+            _API_CLIENT.update(key=cache_key, client=kubernetes.client.ApiClient())
 
     # The return makes unit testing easier
     return {"kubeconfig": kubeconfig, "context": context}
@@ -162,7 +191,7 @@ def ping(**kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.get_api_resources()
         return bool(api_response and hasattr(api_response, "resources") and api_response.resources)
     except (ApiException, HTTPError):
@@ -184,8 +213,10 @@ def nodes(**kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
-        api_response = api_instance.list_node()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
+        # resourceVersion=0 lets the API server answer from its watch cache
+        # instead of doing a quorum read against etcd
+        api_response = api_instance.list_node(resource_version="0")
 
         return [k8s_node["metadata"]["name"] for k8s_node in api_response.to_dict().get("items")]
     except (ApiException, HTTPError) as exc:
@@ -209,22 +240,17 @@ def node(name, **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
-        api_response = api_instance.list_node()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
+        api_response = api_instance.read_node(name)
+        return api_response.to_dict()
     except (ApiException, HTTPError) as exc:
         if isinstance(exc, ApiException) and exc.status == 404:
             return None
-        log.exception("Exception when calling CoreV1Api->list_node")
+        log.exception("Exception when calling CoreV1Api->read_node")
         raise CommandExecutionError(exc)
     finally:
         _cleanup(**cfg)
 
-    for k8s_node in api_response.items:
-        if k8s_node.metadata.name == name:
-            return k8s_node.to_dict()
-
-    return None
-
 
 def node_labels(name, **kwargs):
     """
@@ -271,7 +297,7 @@ def node_add_label(node_name, label_name, label_value, **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         # First verify the node exists
         try:
             api_instance.read_node(node_name)
@@ -310,7 +336,7 @@ def node_remove_label(node_name, label_name, **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         body = {"metadata": {"labels": {label_name: None}}}
         api_response = api_instance.patch_node(node_name, body)
         return api_response
@@ -323,6 +349,41 @@ def node_remove_label(node_name, label_name, **kwargs):
         _cleanup(**cfg)
 
 
+def node_remove_labels(node_name, label_names, **kwargs):
+    """
+    .. versionadded:: 2.0.0
+
+    Removes all labels listed in `label_names` from the node identified
+    by the name `node_name` with a single API call.
+
+    node_name
+        The name of the node
+
+    label_names
+        A list of label names to remove
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt '*' kubernetes.node_remove_labels node_name="minikube" \
+            label_names='["foo", "bar"]'
+    """
+    cfg = _setup_conn(**kwargs)
+    try:
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
+        body = {"metadata": {"labels": {label_name: None for label_name in label_names}}}
+        api_response = api_instance.patch_node(node_name, body)
+        return api_response
+    except (ApiException, HTTPError) as exc:
+        if isinstance(exc, ApiException) and exc.status == 404:
+            raise CommandExecutionError(f"Node {node_name} not found") from exc
+        log.exception("Exception when calling CoreV1Api->patch_node")
+        raise CommandExecutionError(exc)
+    finally:
+        _cleanup(**cfg)
+
+
 def namespaces(**kwargs):
     """
     Return the names of the available namespaces
@@ -335,7 +396,7 @@ def namespaces(**kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.list_namespace()
 
         return [nms["metadata"]["name"] for nms in api_response.to_dict().get("items")]
@@ -364,7 +425,7 @@ def deployments(namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.AppsV1Api()
+        api_instance = kubernetes.client.AppsV1Api(_api_client())
         api_response = api_instance.list_namespaced_deployment(namespace)
 
         return [dep["metadata"]["name"] for dep in api_response.to_dict().get("items")]
@@ -393,7 +454,7 @@ def services(namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.list_namespaced_service(namespace)
 
         return [srv["metadata"]["name"] for srv in api_response.to_dict().get("items")]
@@ -422,7 +483,7 @@ def pods(namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.list_namespaced_pod(namespace)
         return [pod["metadata"]["name"] for pod in api_response.to_dict().get("items", [])]
     except (ApiException, HTTPError) as exc:
@@ -450,7 +511,7 @@ def secrets(namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.list_namespaced_secret(namespace)
 
         return [secret["metadata"]["name"] for secret in api_response.to_dict().get("items")]
@@ -479,7 +540,7 @@ def configmaps(namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.list_namespaced_config_map(namespace)
 
         return [
@@ -513,7 +574,7 @@ def show_deployment(name, namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.AppsV1Api()
+        api_instance = kubernetes.client.AppsV1Api(_api_client())
         api_response = api_instance.read_namespaced_deployment(name, namespace)
 
         return api_response.to_dict()
@@ -545,7 +606,7 @@ def show_service(name, namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.read_namespaced_service(name, namespace)
 
         return api_response.to_dict()
@@ -577,7 +638,7 @@ def show_pod(name, namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.read_namespaced_pod(name, namespace)
 
         return api_response.to_dict()
@@ -606,7 +667,7 @@ def show_namespace(name, **kwargs):
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.read_namespace(name)
         return api_response.to_dict()
     except ApiException as exc:
@@ -646,7 +707,7 @@ def show_secret(name, namespace="default", decode=False, **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.read_namespaced_secret(name, namespace)
         response_dict = api_response.to_dict()
 
@@ -688,7 +749,7 @@ def show_configmap(name, namespace="default", **kwargs):
     """
     cfg = _setup_conn(**kwargs)
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.read_namespaced_config_map(name, namespace)
 
         return api_response.to_dict()
@@ -731,7 +792,7 @@ def delete_deployment(name, namespace="default", wait=False, timeout=60, **kwarg
     body = kubernetes.client.V1DeleteOptions(orphan_dependents=True)
 
     try:
-        api_instance = kubernetes.client.AppsV1Api()
+        api_instance = kubernetes.client.AppsV1Api(_api_client())
         api_response = api_instance.delete_namespaced_deployment(
             name=name, namespace=namespace, body=body
         )
@@ -782,7 +843,7 @@ def delete_service(name, namespace="default", wait=False, timeout=60, **kwargs):
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.delete_namespaced_service(name=name, namespace=namespace)
 
         if wait:
@@ -802,7 +863,9 @@ def delete_service(name, namespace="default", wait=False, timeout=60, **kwargs):
         _cleanup(**cfg)
 
 
-def delete_pod(name, namespace="default", wait=False, timeout=60, **kwargs):
+def delete_pod(
+    name, namespace="default", wait=False, timeout=60, grace_period_seconds=None, **kwargs
+):
     """
     Deletes the kubernetes pod defined by name and namespace
 
@@ -822,18 +885,28 @@ def delete_pod(name, namespace="default", wait=False, timeout=60, **kwargs):
 
         Timeout in seconds to wait for deletion (default: 60)
 
+    grace_period_seconds
+        .. versionadded:: 2.0.0
+
+        The time in seconds the pod's containers are given to shut down.
+        ``0`` deletes the pod immediately. Defaults to the pod's own
+        ``terminationGracePeriodSeconds``.
+
     CLI Example:
 
     .. code-block:: bash
 
         salt '*' kubernetes.delete_pod guestbook-708336848-5nl8c default
         salt '*' kubernetes.delete_pod name=guestbook-708336848-5nl8c namespace=default
+        salt '*' kubernetes.delete_pod name=guestbook-708336848-5nl8c grace_period_seconds=0
     """
     cfg = _setup_conn(**kwargs)
-    body = kubernetes.client.V1DeleteOptions(orphan_dependents=True)
+    body = kubernetes.client.V1DeleteOptions(
+        orphan_dependents=True, grace_period_seconds=grace_period_seconds
+    )
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.delete_namespaced_pod(name=name, namespace=namespace, body=body)
 
         if wait:
@@ -881,7 +954,7 @@ def delete_namespace(name, wait=False, timeout=60, **kwargs):
     body = kubernetes.client.V1DeleteOptions(orphan_dependents=True)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.delete_namespace(name=name, body=body)
 
         if wait:
@@ -936,7 +1009,7 @@ def delete_secret(name, namespace="default", wait=False, timeout=60, **kwargs):
     body = kubernetes.client.V1DeleteOptions(orphan_dependents=True)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.delete_namespaced_secret(
             name=name, namespace=namespace, body=body
         )
@@ -988,7 +1061,7 @@ def delete_configmap(name, namespace="default", wait=False, timeout=60, **kwargs
     body = kubernetes.client.V1DeleteOptions(orphan_dependents=True)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.delete_namespaced_config_map(
             name=name, namespace=namespace, body=body
         )
@@ -1088,7 +1161,7 @@ def create_deployment(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.AppsV1Api()
+        api_instance = kubernetes.client.AppsV1Api(_api_client())
         api_response = api_instance.create_namespaced_deployment(namespace, body)
 
         if wait:
@@ -1200,7 +1273,7 @@ def create_pod(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.create_namespaced_pod(namespace, body)
 
         if wait:
@@ -1324,7 +1397,7 @@ def create_service(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.create_namespaced_service(namespace, body)
 
         if wait:
@@ -1466,7 +1539,7 @@ def create_secret(
     )
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.create_namespaced_secret(namespace, body)
 
         if wait:
@@ -1583,7 +1656,7 @@ def create_configmap(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.create_namespaced_config_map(namespace, body)
 
         if wait:
@@ -1626,7 +1699,7 @@ def create_namespace(name, **kwargs):
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.create_namespace(body)
         return api_response.to_dict()
     except ApiException as exc:
@@ -1722,7 +1795,7 @@ def replace_deployment(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.AppsV1Api()
+        api_instance = kubernetes.client.AppsV1Api(_api_client())
         api_response = api_instance.replace_namespaced_deployment(name, namespace, body)
 
         if wait:
@@ -1844,7 +1917,7 @@ def replace_service(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.replace_namespaced_service(name, namespace, body)
 
         if wait:
@@ -1978,7 +2051,9 @@ def replace_secret(
 
     # Get existing secret type if not specified
     if not type:
-        existing_secret = kubernetes.client.CoreV1Api().read_namespaced_secret(name, namespace)
+        existing_secret = kubernetes.client.CoreV1Api(_api_client()).read_namespaced_secret(
+            name, namespace
+        )
         secret_type = existing_secret.type
 
     body = kubernetes.client.V1Secret(
@@ -1990,7 +2065,7 @@ def replace_secret(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.replace_namespaced_secret(name, namespace, body)
 
         if wait:
@@ -2083,7 +2158,7 @@ def replace_configmap(
     cfg = _setup_conn(**kwargs)
 
     try:
-        api_instance = kubernetes.client.CoreV1Api()
+        api_instance = kubernetes.client.CoreV1Api(_api_client())
         api_response = api_instance.replace_namespaced_config_map(name, namespace, body)
 
         if wait:
@@ -2542,32 +2617,41 @@ def _wait_for_resource_status(
 
     Returns True if the resource reached the expected status, False otherwise.
     """
+    if expected_status == "ready" and resource_type in ("secret", "config_map"):
+        # Secrets and configmaps have no status to converge on, the successful
+        # write that precedes this call already returned the stored object
+        return True
+
     try:
         w = Watch()
         start_time = time.time()
 
         if expected_status == "deleted":
-            # For deletion, periodically check if the resource still exists until timeout
-            while time.time() - start_time < timeout:
-                try:
-                    if resource_type == "deployment":
-                        api_instance.read_namespaced_deployment(name, namespace)
-                    elif resource_type == "namespace":
-                        api_instance.read_namespace(name)
-                    elif resource_type == "service":
-                        api_instance.read_namespaced_service(name, namespace)
-                    elif resource_type == "pod":
-                        api_instance.read_namespaced_pod(name, namespace)
-                    elif resource_type == "secret":
-                        api_instance.read_namespaced_secret(name, namespace)
-                    elif resource_type == "configmap":
-                        api_instance.read_namespaced_config_map(name, namespace)
-                except ApiException as e:
-                    if e.status == 404:
-                        # Resource is gone, deletion successful
-                        return True
-                # Resource still exists, wait before retrying
-                time.sleep(1)
+            # Read the resource once. A 404 means it is already gone, otherwise its
+            # resourceVersion lets the watch below pick up the DELETED event without
+            # missing anything that happened in between.
+            kind = "config_map" if resource_type == "configmap" else resource_type
+            if kind == "namespace":
+                scope, scope_kwargs = "", {}
+            else:
+                scope, scope_kwargs = "namespaced_", {"namespace": namespace}
+            try:
+                resource = getattr(api_instance, f"read_{scope}{kind}")(name, **scope_kwargs)
+            except ApiException as e:
+                if e.status == 404:
+                    # Resource is gone, deletion successful
+                    return True
+                raise
+
+            for event in w.stream(
+                func=getattr(api_instance, f"list_{scope}{kind}"),
+                field_selector=f"metadata.name={name}",
+                resource_version=resource.metadata.resource_version,
+                timeout_seconds=max(1, int(timeout - (time.time() - start_time))),
+                **scope_kwargs,
+            ):
+                if event["type"] == "DELETED":
+                    return True
             # Timed out waiting for deletion
             return False
 
@@ -2607,7 +2691,7 @@ def _wait_for_resource_status(
                                 return True
                     elif resource_type == "service":
                         # For services, check if endpoints exist
-                        endpoints_api = kubernetes.client.CoreV1Api()
+                        endpoints_api = kubernetes.client.CoreV1Api(_api_client())
                         try:
                             endpoints = endpoints_api.read_namespaced_endpoints(name, namespace)
                             if endpoints and endpoints.subsets:
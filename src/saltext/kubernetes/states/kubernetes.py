@@ -1398,14 +1398,15 @@ def node_label_folder_absent(name, node, **kwargs):
         ret["result"] = None
         return ret
 
-    for label in labels_to_drop:
-        try:
-            __salt__["kubernetes.node_remove_label"](node_name=node, label_name=label, **kwargs)
-        except CommandExecutionError as err:
-            log.exception(str(err), exc_info_on_loglevel=logging.DEBUG)
-            ret["result"] = False
-            ret["comment"] = str(err)
-            return ret
+    try:
+        __salt__["kubernetes.node_remove_labels"](
+            node_name=node, label_names=labels_to_drop, **kwargs
+        )
+    except CommandExecutionError as err:
+        log.exception(str(err), exc_info_on_loglevel=logging.DEBUG)
+        ret["result"] = False
+        ret["comment"] = str(err)
+        return ret
 
     ret["result"] = True
     ret["changes"] = {
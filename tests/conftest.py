@@ -1,10 +1,19 @@
+import concurrent.futures
+import hashlib
 import logging
 import os
+import pathlib
+import random
+import shutil
 import subprocess
+import time
 
+import kubernetes
 import pytest
+from kubernetes.client.rest import ApiException
 from pytest_kind import KindCluster
 from saltfactories.utils import random_string
+from urllib3.exceptions import HTTPError
 
 from saltext.kubernetes import PACKAGE_ROOT
 
@@ -21,6 +30,19 @@ K8S_VERSIONS = [
     "v1.32.0",
 ]  # pragma: no cover
 
+# Set KIND_REUSE_CLUSTER=1 to keep kind clusters around after the test run
+# and reuse them on the next one instead of recreating them
+KIND_REUSE_CLUSTER = os.environ.get("KIND_REUSE_CLUSTER", "0") == "1"
+
+# Set CI_SKIP_KIND_DELETE=1 on ephemeral runners that are discarded after the
+# run to skip deleting the last cluster of the session. Clusters of earlier
+# versions are still deleted so they don't compete with the next one.
+KIND_SKIP_DELETE = os.environ.get("CI_SKIP_KIND_DELETE", "0") == "1"
+
+# Set SALT_TEST_ROOT_DIR to place the salt daemons' config, cache and sockets
+# somewhere other than the pytest temp dir, e.g. a tmpfs like /dev/shm
+SALT_TEST_ROOT_DIR = os.environ.get("SALT_TEST_ROOT_DIR")
+
 # This swallows all logging to stdout.
 # To show select logs, set --log-cli-level=<level>
 for handler in logging.root.handlers[:]:  # pragma: no cover
@@ -28,19 +50,36 @@ for handler in logging.root.handlers[:]:  # pragma: no cover
     handler.close()
 
 
+def pytest_configure(config):  # pragma: no cover
+    """
+    The kind clusters are pinned to workers with ``xdist_group`` marks, which
+    only take effect with ``--dist=loadgroup``. With any other distribution
+    every worker would bring up a cluster for every Kubernetes version.
+    """
+    if hasattr(config, "workerinput"):
+        return
+    if config.getoption("numprocesses", None) and config.getoption("dist") != "loadgroup":
+        raise pytest.UsageError("Running the tests with -n requires --dist=loadgroup")
+
+
 @pytest.fixture(scope="session")
 def salt_factories_config():  # pragma: no cover
     """
     Return a dictionary with the keyword arguments for FactoriesManager
     """
-    return {
+    config = {
         "code_dir": str(PACKAGE_ROOT),
         "inject_sitecustomize": "COVERAGE_PROCESS_START" in os.environ,
         "start_timeout": 120 if os.environ.get("CI") else 60,
     }
+    if SALT_TEST_ROOT_DIR:
+        # Daemon ids are not unique across xdist workers, keep them apart
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        config["root_dir"] = str(pathlib.Path(SALT_TEST_ROOT_DIR) / worker)
+    return config
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def master_config():  # pragma: no cover
     """
     Salt master configuration overrides for integration tests.
@@ -48,96 +87,248 @@ def master_config():  # pragma: no cover
     return {}
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def master(salt_factories, master_config):  # pragma: no cover
     return salt_factories.salt_master_daemon(random_string("master-"), overrides=master_config)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def minion_config(kind_cluster):  # pragma: no cover
     """
     Salt minion configuration overrides for integration tests.
     """
     return {
         "kubernetes.kubeconfig": str(kind_cluster.kubeconfig_path),
-        "kubernetes.context": "kind-salt-test",
+        "kubernetes.context": kind_cluster.context,
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def minion(master, minion_config):  # pragma: no cover
     return master.salt_minion_daemon(random_string("minion-"), overrides=minion_config)
 
 
-@pytest.fixture(scope="session", params=K8S_VERSIONS)
-def kind_cluster(request):  # pragma: no cover
+def _is_ready(obj):  # pragma: no cover
     """
-    Create Kind cluster for testing with specified Kubernetes version
+    Return True if the node/pod object reports a ``Ready=True`` condition
+    """
+    conditions = obj.status.conditions or []
+    return any(cond.type == "Ready" and cond.status == "True" for cond in conditions)
+
+
+def _nodes_ready(api, request_timeout):  # pragma: no cover
     """
-    cluster = KindCluster(name="salt-test", image=f"kindest/node:{request.param}")
+    Return True if all nodes are ready
+    """
+    node_list = api.list_node(_request_timeout=request_timeout)
+    return bool(node_list.items) and all(_is_ready(item) for item in node_list.items)
+
+
+def _pods_ready(api, request_timeout):  # pragma: no cover
+    """
+    Return True if all ``kube-system`` pods are ready
+    """
+    pod_list = api.list_namespaced_pod("kube-system", _request_timeout=request_timeout)
+    return bool(pod_list.items) and all(_is_ready(item) for item in pod_list.items)
+
+
+def _wait_for_cluster(
+    cluster, timeout=180, interval=0.25, required_successes=4, request_timeout=5
+):  # pragma: no cover
+    """
+    Poll the API server until the cluster has been observed ready
+    ``required_successes`` times in a row.
+
+    Every API request is bounded by ``request_timeout`` seconds so a
+    half-started API server cannot stall the poll past its deadline. While
+    the API server is unreachable, retries back off exponentially (capped
+    at 5 seconds, with jitter so parallel workers don't poll in lockstep).
+    """
+    api_client = kubernetes.config.new_client_from_config(
+        config_file=str(cluster.kubeconfig_path), context=cluster.context
+    )
+    api = kubernetes.client.CoreV1Api(api_client)
+    deadline = time.monotonic() + timeout
+    successes = 0
+    failures = 0
+    nodes_ready = False
     err = None
     try:
-        cluster.create()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            while time.monotonic() < deadline:
+                try:
+                    # The pod check runs alongside the node check. Nodes are only
+                    # listed until they have been seen ready once, after which
+                    # each poll is a single request for the pods.
+                    pods_future = pool.submit(_pods_ready, api, request_timeout)
+                    nodes_ready = nodes_ready or _nodes_ready(api, request_timeout)
+                    ready = pods_future.result() and nodes_ready
+                    failures = 0
+                except (ApiException, HTTPError) as exc:
+                    ready = False
+                    err = exc
+                    failures += 1
+                successes = successes + 1 if ready else 0
+                if successes >= required_successes:
+                    return
+                if failures:
+                    time.sleep(min(5.0, interval * 2**failures) + random.uniform(0, 0.1))
+                else:
+                    time.sleep(interval)
+    finally:
+        api_client.close()
 
-        # Wait for and validate cluster readiness using kubectl
-        retries = 5
-        context = "kind-salt-test"
-        while retries > 0:
-            try:
-                # Verify cluster is accessible
-                kubectl_cmd = [
-                    "kubectl",
-                    "--context",
-                    context,
-                    "--kubeconfig",
-                    str(cluster.kubeconfig_path),
-                ]
-
-                subprocess.run(
-                    kubectl_cmd + ["cluster-info"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                # Wait longer for node readiness
-                subprocess.run(
-                    kubectl_cmd
-                    + ["wait", "--for=condition=ready", "nodes", "--all", "--timeout=120s"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                # Verify core services are running with longer timeout
-                subprocess.run(
-                    kubectl_cmd
-                    + [
-                        "wait",
-                        "--for=condition=Ready",
-                        "pods",
-                        "--all",
-                        "-n",
-                        "kube-system",
-                        "--timeout=120s",
-                    ],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                break
-            except subprocess.CalledProcessError as exc:  # pylint: disable=try-except-raise
-                retries -= 1
-                err = exc
-        else:
-            log.error("Failed to validate cluster:")
-            log.error("stdout: %s", err.stdout)
-            log.error("stderr: %s", err.stderr)
-            raise err
+    raise RuntimeError(
+        f"Kind cluster {cluster.name} was not ready after {timeout} seconds (last error: {err})"
+    )
 
-        yield cluster
-    finally:
+
+@pytest.fixture(scope="session")
+def _prepull_kind_images():  # pragma: no cover
+    """
+    Pull the node images of all tested Kubernetes versions concurrently
+    before the first cluster is created.
+
+    Under pytest-xdist nothing is pulled up front, every worker only needs the
+    images of its own clusters and kind pulls those on create.
+
+    Set ``KIND_NO_PREPULL=1`` to skip this.
+    """
+    if os.environ.get("KIND_NO_PREPULL", "0") == "1" or os.environ.get("PYTEST_XDIST_WORKER"):
+        return
+
+    if shutil.which("docker") is None:
+        # Not fatal, e.g. kind running on podman pulls the image itself on create
+        log.warning("docker not found, not pre-pulling the kind node images")
+        return
+
+    def _pull(version):
+        image = f"kindest/node:{version}"
+        ret = subprocess.run(
+            ["docker", "pull", image],
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if ret.returncode != 0:
+            # Not fatal, kind will try pulling the image again on create
+            log.warning("Failed to pre-pull %s: %s", image, ret.stderr.decode())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(K8S_VERSIONS)) as pool:
+        list(pool.map(_pull, K8S_VERSIONS))
+
+
+def _kind_cluster_name(image):  # pragma: no cover
+    """
+    Return the kind cluster name for the current pytest process.
+
+    When running under pytest-xdist, every worker brings up its own cluster,
+    so the worker id is appended to keep the names unique.
+    """
+    name = "salt-test"
+    if KIND_REUSE_CLUSTER or KIND_SKIP_DELETE:
+        # Key kept clusters on the node image so they are never picked up
+        # for a different Kubernetes version
+        name += "-" + hashlib.sha256(image.encode()).hexdigest()[:8]
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id:
+        name += f"-{worker_id}"
+    return name
+
+
+def _export_kind_kubeconfig(cluster):  # pragma: no cover
+    """
+    Write the kubeconfig of an existing kind cluster named like ``cluster`` to
+    its kubeconfig path.
+
+    pytest-kind only touches the kubeconfig of a cluster it did not create in
+    this checkout, so without this a cluster that outlived ``.pytest-kind/``
+    could not be loaded. Returns False if there is no such cluster.
+
+    A failed export is only logged, loading the cluster then fails and the
+    caller recreates it.
+    """
+    cluster.ensure_kind()
+    ret = subprocess.run(
+        [str(cluster.kind_path), "get", "clusters"],
+        check=True,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    if cluster.name not in ret.stdout.splitlines():
+        return False
+    cluster.kubeconfig_path.parent.mkdir(parents=True, exist_ok=True)
+    ret = subprocess.run(
+        [
+            str(cluster.kind_path),
+            "export",
+            "kubeconfig",
+            "--name",
+            cluster.name,
+            "--kubeconfig",
+            str(cluster.kubeconfig_path),
+        ],
+        check=False,
+        capture_output=True,
+        encoding="utf-8",
+    )
+    if ret.returncode != 0:
+        log.warning("Failed to export the kubeconfig of %s: %s", cluster.name, ret.stderr)
+    return True
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        pytest.param(version, marks=pytest.mark.xdist_group(name=version))
+        for version in K8S_VERSIONS
+    ],
+)
+def kind_cluster(request, _prepull_kind_images):  # pragma: no cover
+    """
+    Create Kind cluster for testing with specified Kubernetes version
+
+    Each version is pinned to an xdist group, so running with
+    ``-n <workers> --dist=loadgroup`` brings up the versions concurrently.
+    """
+    image = f"kindest/node:{request.param}"
+    # pytest-kind downloads kind and kubectl into every cluster's own directory,
+    # share one copy per process instead. xdist workers get their own copy so
+    # they don't download to the same file at once.
+    bin_dir = pathlib.Path(".pytest-kind", "bin", os.environ.get("PYTEST_XDIST_WORKER", "main"))
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    cluster = KindCluster(
+        name=_kind_cluster_name(image),
+        image=image,
+        kind_path=bin_dir / "kind",
+        kubectl_path=bin_dir / "kubectl",
+    )
+    cluster.context = f"kind-{cluster.name}"
+    try:
+        reused = KIND_REUSE_CLUSTER and _export_kind_kubeconfig(cluster)
         try:
-            cluster.delete()
+            # pytest-kind reuses an existing cluster with the same name
+            cluster.create()
+            # A reused cluster is already up, don't sit out the full timeout
+            # when it is broken
+            _wait_for_cluster(cluster, timeout=30 if reused else 180)
         except Exception:  # pylint: disable=broad-except
-            log.error("Failed to delete cluster", exc_info=True)
+            if not reused:
+                raise
+            log.warning(
+                "Reused kind cluster %s is not healthy, recreating it", cluster.name, exc_info=True
+            )
+            cluster.delete()
+            cluster.create()
+            _wait_for_cluster(cluster)
+        yield cluster
+    finally:
+        if KIND_REUSE_CLUSTER:
+            log.info("Keeping kind cluster %s for reuse", cluster.name)
+        elif KIND_SKIP_DELETE and request.param == K8S_VERSIONS[-1]:
+            log.info("Skipping kind delete of cluster %s on ephemeral CI", cluster.name)
+        else:
+            try:
+                cluster.delete()
+            except Exception:  # pylint: disable=broad-except
+                log.error("Failed to delete cluster", exc_info=True)
@@ -32,15 +32,12 @@ def state_tree_prod(tmp_path_factory):  # pragma: no cover
 
 
 @pytest.fixture(scope="module")
-def minion_config_defaults(kind_cluster):  # pragma: no cover
+def minion_config_defaults(minion_config):  # pragma: no cover
     """
     Functional test modules can provide this fixture to tweak the default
     configuration dictionary passed to the minion factory
     """
-    return {
-        "kubernetes.kubeconfig": str(kind_cluster.kubeconfig_path),
-        "kubernetes.context": "kind-salt-test",
-    }
+    return minion_config.copy()
 
 
 @pytest.fixture(scope="module")
@@ -207,7 +204,7 @@ def pod(kubernetes_exe, pod_spec, request):
     try:
         yield {"name": name, "namespace": namespace, "spec": pod_spec}
     finally:
-        kubernetes_exe.delete_pod(name, namespace, wait=True)
+        kubernetes_exe.delete_pod(name, namespace, wait=True, grace_period_seconds=0)
         assert kubernetes_exe.show_pod(name=name, namespace=namespace) is None
 
 
@@ -341,7 +338,10 @@ def node_name(loaders):
     # Get a node to test with (use control-plane node)
     nodes = loaders.modules.kubernetes.nodes()
     assert nodes, "No nodes found in cluster"
-    return next(node for node in nodes if "control-plane" in node)
+    if len(nodes) == 1:
+        return nodes[0]
+    # kind names its control-plane node <cluster-name>-control-plane
+    return next(node for node in nodes if node.endswith("-control-plane"))
 
 
 @pytest.fixture(params=[True])
@@ -378,8 +378,8 @@ def labeled_node(kubernetes_exe, request, node_name):
         # cleanup labels created in the test
         final_labels = set(kubernetes_exe.node_labels(node_name))
         labels_to_remove = final_labels - set(initial_labels)
-        for remove_key in labels_to_remove:
-            kubernetes_exe.node_remove_label(node_name, remove_key)
+        if labels_to_remove:
+            kubernetes_exe.node_remove_labels(node_name, list(labels_to_remove))
 
         cleaned_labels = set(kubernetes_exe.node_labels(node_name))
         assert not cleaned_labels - set(initial_labels)
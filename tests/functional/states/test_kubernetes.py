@@ -1,5 +1,5 @@
+import copy
 import logging
-from textwrap import dedent
 
 import pytest
 
@@ -9,6 +9,126 @@ pytestmark = [
     pytest.mark.skip_unless_on_linux(reason="Only run on Linux platforms"),
 ]
 
+TEST_LABELS = {"app": "test"}
+
+NGINX_CONTAINER = {
+    "name": "nginx",
+    "image": "nginx:latest",
+    "ports": [{"containerPort": 80}],
+}
+
+POD_SPEC = {"containers": [NGINX_CONTAINER]}
+
+DEPLOYMENT_SPEC = {
+    "replicas": 2,
+    "selector": {"matchLabels": TEST_LABELS},
+    "template": {
+        "metadata": {"labels": TEST_LABELS},
+        "spec": POD_SPEC,
+    },
+}
+
+NAMESPACE_TEMPLATE = """\
+apiVersion: v1
+kind: Namespace
+metadata:
+    name: {{ name }}
+    labels: {{ labels | json }}
+"""
+
+POD_TEMPLATE = """\
+apiVersion: v1
+kind: Pod
+metadata:
+  name: {{ name }}
+  namespace: {{ namespace }}
+  labels: {{ labels | json }}
+spec:
+  containers:
+  - name: {{ name }}
+    image: {{ image }}
+    ports:
+    - containerPort: 80
+"""
+
+DEPLOYMENT_TEMPLATE = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: {{ name }}
+  namespace: {{ namespace }}
+  labels: {{ labels | json }}
+spec:
+  replicas: {{ replicas }}
+  selector:
+    matchLabels:
+      app: {{ app_label }}
+  template:
+    metadata:
+      labels: {{ labels | json }}
+    spec:
+      containers:
+      - name: {{ name }}
+        image: {{ image }}
+        ports:
+        - containerPort: 80
+"""
+
+SECRET_TEMPLATE = """\
+apiVersion: v1
+kind: Secret
+metadata:
+  name: {{ name }}
+  namespace: {{ namespace }}
+  labels: {{ labels | json }}
+type: {{ secret_type }}
+data: {{ secret_data | json }}
+"""
+
+SERVICE_TEMPLATE = """\
+apiVersion: v1
+kind: Service
+metadata:
+  name: {{ name }}
+  namespace: {{ namespace }}
+  labels: {{ labels | json }}
+spec:
+  type: {{ type }}
+  ports: {{ ports | json }}
+  selector: {{ selector | json }}
+"""
+
+CONFIGMAP_TEMPLATE = """\
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: {{ name }}
+  namespace: {{ namespace }}
+  labels: {{ labels | json }}
+data: {{ data | json }}
+"""
+
+TEMPLATES = {
+    "namespace": NAMESPACE_TEMPLATE,
+    "pod": POD_TEMPLATE,
+    "deployment": DEPLOYMENT_TEMPLATE,
+    "secret": SECRET_TEMPLATE,
+    "service": SERVICE_TEMPLATE,
+    "configmap": CONFIGMAP_TEMPLATE,
+}
+
+
+@pytest.fixture(scope="module")
+def k8s_templates(state_tree):
+    """
+    Write all Jinja templates to the state tree once per module
+    """
+    sls_dir = "k8s"
+    (state_tree / sls_dir).mkdir(exist_ok=True)
+    for kind, template in TEMPLATES.items():
+        (state_tree / sls_dir / f"{kind}-template.yml.jinja").write_text(template)
+    return sls_dir
+
 
 @pytest.fixture
 def kubernetes(states):
@@ -59,21 +179,9 @@ def test_namespace_present_idempotency(kubernetes, namespace):
     assert "already exists" in ret.comment
 
 
-@pytest.fixture
-def namespace_template(state_tree):
-    sls = "k8s/namespace-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Namespace
-        metadata:
-            name: {{ name }}
-            labels: {{ labels | json }}
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def namespace_template(k8s_templates):
+    return f"salt://{k8s_templates}/namespace-template.yml.jinja"
 
 
 @pytest.mark.parametrize("namespace", [False], indirect=True)
@@ -141,41 +249,14 @@ def test_namespace_absent_idempotency(kubernetes, namespace):
     assert not ret.changes
 
 
-@pytest.fixture
-def pod_template(state_tree):
-    sls = "k8s/pod-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Pod
-        metadata:
-          name: {{ name }}
-          namespace: {{ namespace }}
-          labels: {{ labels | json }}
-        spec:
-          containers:
-          - name: {{ name }}
-            image: {{ image }}
-            ports:
-            - containerPort: 80
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def pod_template(k8s_templates):
+    return f"salt://{k8s_templates}/pod-template.yml.jinja"
 
 
 @pytest.fixture
 def pod_spec():
-    return {
-        "containers": [
-            {
-                "name": "nginx",
-                "image": "nginx:latest",
-                "ports": [{"containerPort": 80}],
-            }
-        ]
-    }
+    return copy.deepcopy(POD_SPEC)
 
 
 @pytest.mark.parametrize("pod", [False], indirect=True)
@@ -295,56 +376,14 @@ def test_pod_absent_idempotency(kubernetes, pod):
     assert not ret.changes
 
 
-@pytest.fixture
-def deployment_template(state_tree):
-    sls = "k8s/deployment-template"
-    contents = dedent(
-        """
-        apiVersion: apps/v1
-        kind: Deployment
-        metadata:
-          name: {{ name }}
-          namespace: {{ namespace }}
-          labels: {{ labels | json }}
-        spec:
-          replicas: {{ replicas }}
-          selector:
-            matchLabels:
-              app: {{ app_label }}
-          template:
-            metadata:
-              labels: {{ labels | json }}
-            spec:
-              containers:
-              - name: {{ name }}
-                image: {{ image }}
-                ports:
-                - containerPort: 80
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def deployment_template(k8s_templates):
+    return f"salt://{k8s_templates}/deployment-template.yml.jinja"
 
 
 @pytest.fixture
 def deployment_spec():
-    return {
-        "replicas": 2,
-        "selector": {"matchLabels": {"app": "test"}},
-        "template": {
-            "metadata": {"labels": {"app": "test"}},
-            "spec": {
-                "containers": [
-                    {
-                        "name": "nginx",
-                        "image": "nginx:latest",
-                        "ports": [{"containerPort": 80}],
-                    }
-                ]
-            },
-        },
-    }
+    return copy.deepcopy(DEPLOYMENT_SPEC)
 
 
 @pytest.mark.parametrize("deployment", [False], indirect=True)
@@ -582,24 +621,9 @@ def test_secret_present_replace(kubernetes, secret, kubernetes_exe):
     assert secret_state["data"]["key"] == "new_value"
 
 
-@pytest.fixture
-def secret_template(state_tree):
-    sls = "k8s/secret-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Secret
-        metadata:
-          name: {{ name }}
-          namespace: {{ namespace }}
-          labels: {{ labels | json }}
-        type: {{ secret_type }}
-        data: {{ secret_data | json }}
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def secret_template(k8s_templates):
+    return f"salt://{k8s_templates}/secret-template.yml.jinja"
 
 
 @pytest.mark.parametrize("secret", [False], indirect=True)
@@ -809,26 +833,9 @@ def test_service_present_replace(kubernetes, service, kubernetes_exe):
     assert service_state["spec"]["type"] == "NodePort"
 
 
-@pytest.fixture
-def service_template(state_tree):
-    sls = "k8s/service-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Service
-        metadata:
-          name: {{ name }}
-          namespace: {{ namespace }}
-          labels: {{ labels | json }}
-        spec:
-          type: {{ type }}
-          ports: {{ ports | json }}
-          selector: {{ selector | json }}
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def service_template(k8s_templates):
+    return f"salt://{k8s_templates}/service-template.yml.jinja"
 
 
 @pytest.mark.parametrize("service", [False], indirect=True)
@@ -1014,23 +1021,9 @@ def test_configmap_replace(kubernetes, configmap, kubernetes_exe):
     assert configmap_state["data"]["app.properties"] == "app.name=newapp\napp.port=9090"
 
 
-@pytest.fixture
-def configmap_template(state_tree):
-    sls = "k8s/configmap-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: ConfigMap
-        metadata:
-          name: {{ name }}
-          namespace: {{ namespace }}
-          labels: {{ labels | json }}
-        data: {{ data | json }}
-        """
-    ).strip()
-
-    with pytest.helpers.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+@pytest.fixture(scope="module")
+def configmap_template(k8s_templates):
+    return f"salt://{k8s_templates}/configmap-template.yml.jinja"
 
 
 @pytest.mark.parametrize("configmap", [False], indirect=True)
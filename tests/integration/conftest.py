@@ -2,13 +2,13 @@ import pytest
 from saltfactories.utils import random_string
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def master(master):  # pragma: no cover
     with master.started():
         yield master
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def minion(minion):  # pragma: no cover
     with minion.started():
         yield minion
@@ -98,6 +98,7 @@ def pod(salt_call_cli, pod_spec, request):
             name=name,
             namespace=namespace,
             wait=True,
+            grace_period_seconds=0,
         )
         assert res.returncode == 0
 
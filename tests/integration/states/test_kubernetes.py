@@ -1,4 +1,6 @@
+import contextlib
 import logging
+from string import Template
 from textwrap import dedent
 
 import pytest
@@ -9,86 +11,192 @@ pytestmark = [
     pytest.mark.skip_unless_on_linux(reason="Only run on Linux platforms"),
 ]
 
+KINDS = ("namespace", "pod", "deployment", "secret", "service", "configmap")
+
+PRESENT_STATE = Template(
+    """\
+{%- set source = salt['pillar.get']('source') %}
+{%- set name = salt['pillar.get']('name') %}
+
+create_${kind}:
+  kubernetes.${kind}_present:
+    - source: {{ source }}
+    - name: {{ name }}
+${namespace}    - template: jinja
+    - template_context:
+        name: {{ name }}
+    - wait: True
+"""
+)
+
+ABSENT_STATE = Template(
+    """\
+{%- set name = salt['pillar.get']('name') %}
+
+delete_${kind}:
+  kubernetes.${kind}_absent:
+    - name: {{ name }}
+${namespace}    - wait: True
+"""
+)
+
+NAMESPACE_TEMPLATE = dedent(
+    """
+    apiVersion: v1
+    kind: Namespace
+    metadata:
+      name: {{ name }}
+    """
+).strip()
+
+POD_TEMPLATE = dedent(
+    """
+    apiVersion: v1
+    kind: Pod
+    metadata:
+      name: {{ name }}
+      namespace: default
+    spec:
+      containers:
+        - name: nginx
+          image: nginx:latest
+          ports:
+            - containerPort: 80
+    """
+).strip()
+
+DEPLOYMENT_TEMPLATE = dedent(
+    """
+    apiVersion: apps/v1
+    kind: Deployment
+    metadata:
+      name: {{ name }}
+      namespace: default
+    spec:
+      replicas: 2
+      selector:
+        matchLabels:
+          app: test
+      template:
+        metadata:
+          labels:
+            app: test
+        spec:
+          containers:
+            - name: nginx
+              image: nginx:latest
+              ports:
+                - containerPort: 80
+    """
+).strip()
+
+SECRET_TEMPLATE = dedent(
+    """
+    apiVersion: v1
+    kind: Secret
+    metadata:
+      name: {{ name }}
+      namespace: default
+    type: Opaque
+    data:
+      username: YWRtaW4=  # base64 encoded "admin"
+      password: YWRtaW4xMjM=  # base64 encoded "admin123"
+    """
+).strip()
+
+SERVICE_TEMPLATE = dedent(
+    """
+    apiVersion: v1
+    kind: Service
+    metadata:
+      name: {{ name }}
+      namespace: default
+    spec:
+      selector:
+        app: test
+      ports:
+        - protocol: TCP
+          port: 80
+          targetPort: 8080
+          name: http
+        - protocol: TCP
+          port: 443
+          targetPort: 8443
+          name: https
+      type: ClusterIP
+    """
+).strip()
+
+CONFIGMAP_TEMPLATE = dedent(
+    """
+    apiVersion: v1
+    kind: ConfigMap
+    metadata:
+      name: {{ name }}
+      namespace: default
+    data:
+      config.yaml: |
+        foo: bar
+        key: value
+      app.properties: |
+        app.name=myapp
+        app.port=8080
+    """
+).strip()
+
+
+def _namespace_arg(kind):
+    # Namespaces are cluster scoped, everything else lives in the default namespace
+    return "" if kind == "namespace" else "    - namespace: default\n"
+
 
 @pytest.fixture(scope="module")
 def state_tree(master):
     return master.state_tree.base
 
 
-@pytest.fixture
-def namespace_template(state_tree):
+@pytest.fixture(scope="module")
+def present_states(state_tree):
     """
-    Create the template file to be used by the state
+    Create one .sls state file per kind that creates the resource from a template
     """
-    sls = "k8s/namespace-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Namespace
-        metadata:
-          name: {{ name }}
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
-        yield f"salt://{sls}.yml.jinja"
+    with contextlib.ExitStack() as stack:
+        for kind in KINDS:
+            contents = PRESENT_STATE.substitute(kind=kind, namespace=_namespace_arg(kind))
+            stack.enter_context(state_tree.temp_file(f"{kind}_present.sls", contents))
+        yield {kind: f"{kind}_present" for kind in KINDS}
 
 
-@pytest.fixture
-def namespace_present_state(state_tree):
+@pytest.fixture(scope="module")
+def absent_states(state_tree):
     """
-    Create the .sls state file that uses the template
+    Create one .sls state file per kind that deletes the resource
     """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
+    with contextlib.ExitStack() as stack:
+        for kind in KINDS:
+            contents = ABSENT_STATE.substitute(kind=kind, namespace=_namespace_arg(kind))
+            stack.enter_context(state_tree.temp_file(f"{kind}_absent.sls", contents))
+        yield {kind: f"{kind}_absent" for kind in KINDS}
 
-        create_namespace:
-          kubernetes.namespace_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
 
-    sls = "namespace_present"
-    with state_tree.temp_file(f"{sls}.sls", contents):
-        yield sls
-
-
-@pytest.fixture
-def namespace_absent_state(state_tree):
+@pytest.fixture(scope="module")
+def namespace_template(state_tree):
     """
-    Create the .sls state file that uses the template
+    Create the template file to be used by the state
     """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_namespace:
-          kubernetes.namespace_absent:
-            - name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    sls = "namespace_absent"
-    with state_tree.temp_file(f"{sls}.sls", contents):
-        yield sls
+    sls = "k8s/namespace-template"
+    with state_tree.temp_file(f"{sls}.yml.jinja", NAMESPACE_TEMPLATE, state_tree):
+        yield f"salt://{sls}.yml.jinja"
 
 
 @pytest.mark.parametrize("namespace", [False], indirect=True)
-def test_namespace_present(salt_call_cli, namespace, namespace_template, namespace_present_state):
+def test_namespace_present(salt_call_cli, namespace, namespace_template, present_states):
     """
     Test namespace creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        namespace_present_state,
+        present_states["namespace"],
         pillar={
             "name": namespace,
             "source": namespace_template,
@@ -103,18 +211,12 @@ def test_namespace_present(salt_call_cli, namespace, namespace_template, namespa
     assert ret.data["status"]["phase"] == "Active"
 
 
-def test_namespace_absent(salt_call_cli, namespace_absent_state, namespace):
+def test_namespace_absent(salt_call_cli, absent_states, namespace):
     """
     Test namespace deletion via states
     """
-
-    # Verify namespace exists
-    ret = salt_call_cli.run("kubernetes.show_namespace", name=namespace)
-    assert ret.returncode == 0
-    assert ret.data is not None
-
     # Delete the namespace using the state
-    ret = salt_call_cli.run("state.apply", namespace_absent_state, pillar={"name": namespace})
+    ret = salt_call_cli.run("state.apply", absent_states["namespace"], pillar={"name": namespace})
     assert ret.returncode == 0
 
     # Verify namespace is deleted
@@ -123,87 +225,24 @@ def test_namespace_absent(salt_call_cli, namespace_absent_state, namespace):
     assert ret.data is None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pod_template(state_tree):
     """
     Create the template file to be used by the state
     """
     sls = "k8s/pod-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Pod
-        metadata:
-          name: {{ name }}
-          namespace: default
-        spec:
-          containers:
-            - name: nginx
-              image: nginx:latest
-              ports:
-                - containerPort: 80
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
+    with state_tree.temp_file(f"{sls}.yml.jinja", POD_TEMPLATE, state_tree):
         yield f"salt://{sls}.yml.jinja"
 
 
-@pytest.fixture
-def pod_present_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
-
-        create_pod:
-          kubernetes.pod_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - namespace: default
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("pod_present.sls", contents):
-        yield "pod_present"
-
-
-@pytest.fixture
-def pod_absent_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_pod:
-          kubernetes.pod_absent:
-            - name: {{ name }}
-            - namespace: default
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("pod_absent.sls", contents):
-        yield "pod_absent"
-
-
 @pytest.mark.parametrize("pod", [False], indirect=True)
-def test_pod_present(salt_call_cli, pod, pod_template, pod_present_state):
+def test_pod_present(salt_call_cli, pod, pod_template, present_states):
     """
     Test pod creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        pod_present_state,
+        present_states["pod"],
         pillar={
             "name": pod["name"],
             "source": pod_template,
@@ -218,17 +257,12 @@ def test_pod_present(salt_call_cli, pod, pod_template, pod_present_state):
     assert ret.data["status"]["phase"] == "Running"
 
 
-def test_pod_absent(salt_call_cli, pod_absent_state, pod):
+def test_pod_absent(salt_call_cli, absent_states, pod):
     """
     Test pod deletion via states
     """
-    # Verify pod exists
-    ret = salt_call_cli.run("kubernetes.show_pod", name=pod["name"], namespace="default")
-    assert ret.returncode == 0
-    assert ret.data is not None
-
     # Delete the pod using the state
-    ret = salt_call_cli.run("state.apply", pod_absent_state, pillar={"name": pod["name"]})
+    ret = salt_call_cli.run("state.apply", absent_states["pod"], pillar={"name": pod["name"]})
     assert ret.returncode == 0
 
     # Verify pod is deleted
@@ -259,98 +293,24 @@ def deployment_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def deployment_template(state_tree):
     """
     Create the template file to be used by the state
     """
     sls = "k8s/deployment-template"
-    contents = dedent(
-        """
-        apiVersion: apps/v1
-        kind: Deployment
-        metadata:
-          name: {{ name }}
-          namespace: default
-        spec:
-          replicas: 2
-          selector:
-            matchLabels:
-              app: test
-          template:
-            metadata:
-              labels:
-                app: test
-            spec:
-              containers:
-                - name: nginx
-                  image: nginx:latest
-                  ports:
-                    - containerPort: 80
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
+    with state_tree.temp_file(f"{sls}.yml.jinja", DEPLOYMENT_TEMPLATE, state_tree):
         yield f"salt://{sls}.yml.jinja"
 
 
-@pytest.fixture
-def deployment_present_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
-
-        create_deployment:
-          kubernetes.deployment_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - namespace: default
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("deployment_present.sls", contents):
-        yield "deployment_present"
-
-
-@pytest.fixture
-def deployment_absent_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_deployment:
-          kubernetes.deployment_absent:
-            - name: {{ name }}
-            - namespace: default
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("deployment_absent.sls", contents):
-        yield "deployment_absent"
-
-
 @pytest.mark.parametrize("deployment", [False], indirect=True)
-def test_deployment_present(
-    salt_call_cli, deployment, deployment_template, deployment_present_state
-):
+def test_deployment_present(salt_call_cli, deployment, deployment_template, present_states):
     """
     Test deployment creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        deployment_present_state,
+        present_states["deployment"],
         pillar={
             "name": deployment["name"],
             "source": deployment_template,
@@ -367,20 +327,13 @@ def test_deployment_present(
     assert ret.data["spec"]["template"]["spec"]["containers"][0]["name"] == "nginx"
 
 
-def test_deployment_absent(salt_call_cli, deployment, deployment_absent_state):
+def test_deployment_absent(salt_call_cli, deployment, absent_states):
     """
     Test deployment deletion via states
     """
-    # Verify deployment exists
-    ret = salt_call_cli.run(
-        "kubernetes.show_deployment", name=deployment["name"], namespace=deployment["namespace"]
-    )
-    assert ret.returncode == 0
-    assert ret.data is not None
-
     # Delete the deployment using the state
     ret = salt_call_cli.run(
-        "state.apply", deployment_absent_state, pillar={"name": deployment["name"]}
+        "state.apply", absent_states["deployment"], pillar={"name": deployment["name"]}
     )
     assert ret.returncode == 0
 
@@ -392,85 +345,24 @@ def test_deployment_absent(salt_call_cli, deployment, deployment_absent_state):
     assert ret.data is None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def secret_template(state_tree):
     """
     Create the template file to be used by the state
     """
     sls = "k8s/secret-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Secret
-        metadata:
-          name: {{ name }}
-          namespace: default
-        type: Opaque
-        data:
-          username: YWRtaW4=  # base64 encoded "admin"
-          password: YWRtaW4xMjM=  # base64 encoded "admin123"
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
+    with state_tree.temp_file(f"{sls}.yml.jinja", SECRET_TEMPLATE, state_tree):
         yield f"salt://{sls}.yml.jinja"
 
 
-@pytest.fixture
-def secret_present_state(state_tree):
-    """
-    Create the actual .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
-
-        create_secret:
-          kubernetes.secret_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - namespace: default
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("secret_present.sls", contents):
-        yield "secret_present"
-
-
-@pytest.fixture
-def secret_absent_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_secret:
-          kubernetes.secret_absent:
-            - name: {{ name }}
-            - namespace: default
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("secret_absent.sls", contents):
-        yield "secret_absent"
-
-
 @pytest.mark.parametrize("secret", [False], indirect=True)
-def test_secret_present(salt_call_cli, secret, secret_template, secret_present_state):
+def test_secret_present(salt_call_cli, secret, secret_template, present_states):
     """
     Test secret creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        secret_present_state,
+        present_states["secret"],
         pillar={
             "name": secret["name"],
             "source": secret_template,
@@ -488,19 +380,12 @@ def test_secret_present(salt_call_cli, secret, secret_template, secret_present_s
     assert ret.data["data"]["password"] == "admin123"
 
 
-def test_secret_absent(salt_call_cli, secret, secret_absent_state):
+def test_secret_absent(salt_call_cli, secret, absent_states):
     """
     Test secret deletion via states
     """
-    # Verify secret exists
-    ret = salt_call_cli.run(
-        "kubernetes.show_secret", name=secret["name"], namespace=secret["namespace"], decode=True
-    )
-    assert ret.returncode == 0
-    assert ret.data is not None
-
     # Delete the secret using the state
-    ret = salt_call_cli.run("state.apply", secret_absent_state, pillar={"name": secret["name"]})
+    ret = salt_call_cli.run("state.apply", absent_states["secret"], pillar={"name": secret["name"]})
     assert ret.returncode == 0
 
     # Verify secret is deleted
@@ -529,94 +414,24 @@ def service_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service_template(state_tree):
     """
     Create the template file to be used by the state
     """
     sls = "k8s/service-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: Service
-        metadata:
-          name: {{ name }}
-          namespace: default
-        spec:
-          selector:
-            app: test
-          ports:
-            - protocol: TCP
-              port: 80
-              targetPort: 8080
-              name: http
-            - protocol: TCP
-              port: 443
-              targetPort: 8443
-              name: https
-          type: ClusterIP
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
+    with state_tree.temp_file(f"{sls}.yml.jinja", SERVICE_TEMPLATE, state_tree):
         yield f"salt://{sls}.yml.jinja"
 
 
-@pytest.fixture
-def service_present_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
-
-        create_service:
-          kubernetes.service_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - namespace: default
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("service_present.sls", contents):
-        yield "service_present"
-
-
-@pytest.fixture
-def service_absent_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_service:
-          kubernetes.service_absent:
-            - name: {{ name }}
-            - namespace: default
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("service_absent.sls", contents):
-        yield "service_absent"
-
-
 @pytest.mark.parametrize("service", [False], indirect=True)
-def test_service_present(salt_call_cli, service, service_template, service_present_state):
+def test_service_present(salt_call_cli, service, service_template, present_states):
     """
     Test service creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        service_present_state,
+        present_states["service"],
         pillar={
             "name": service["name"],
             "source": service_template,
@@ -635,20 +450,15 @@ def test_service_present(salt_call_cli, service, service_template, service_prese
     assert ret.data["spec"]["selector"]["app"] == "test"
 
 
-def test_service_absent(salt_call_cli, service, service_absent_state):
+def test_service_absent(salt_call_cli, service, absent_states):
     """
     Test service deletion via states
     """
-    # Verify service exists
+    # Delete the service using the state
     ret = salt_call_cli.run(
-        "kubernetes.show_service", name=service["name"], namespace=service["namespace"]
+        "state.apply", absent_states["service"], pillar={"name": service["name"]}
     )
     assert ret.returncode == 0
-    assert ret.data is not None
-
-    # Delete the service using the state
-    ret = salt_call_cli.run("state.apply", service_absent_state, pillar={"name": service["name"]})
-    assert ret.returncode == 0
 
     # Verify service is deleted
     ret = salt_call_cli.run(
@@ -669,88 +479,24 @@ def configmap_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def configmap_template(state_tree):
     """
     Create the .sls state file that uses the template
     """
     sls = "k8s/configmap-template"
-    contents = dedent(
-        """
-        apiVersion: v1
-        kind: ConfigMap
-        metadata:
-          name: {{ name }}
-          namespace: default
-        data:
-          config.yaml: |
-            foo: bar
-            key: value
-          app.properties: |
-            app.name=myapp
-            app.port=8080
-        """
-    ).strip()
-
-    with state_tree.temp_file(f"{sls}.yml.jinja", contents, state_tree):
+    with state_tree.temp_file(f"{sls}.yml.jinja", CONFIGMAP_TEMPLATE, state_tree):
         yield f"salt://{sls}.yml.jinja"
 
 
-@pytest.fixture
-def configmap_present_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set source = salt['pillar.get']('source') %}
-        {%- set name = salt['pillar.get']('name') %}
-
-        create_configmap:
-          kubernetes.configmap_present:
-            - source: {{ source }}
-            - name: {{ name }}
-            - namespace: default
-            - template: jinja
-            - template_context:
-                name: {{ name }}
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("configmap_present.sls", contents):
-        yield "configmap_present"
-
-
-@pytest.fixture
-def configmap_absent_state(state_tree):
-    """
-    Create the .sls state file that uses the template
-    """
-    contents = dedent(
-        """
-        {%- set name = salt['pillar.get']('name') %}
-
-        delete_configmap:
-          kubernetes.configmap_absent:
-            - name: {{ name }}
-            - namespace: default
-            - wait: True
-        """
-    ).strip()
-
-    with state_tree.temp_file("configmap_absent.sls", contents):
-        yield "configmap_absent"
-
-
 @pytest.mark.parametrize("configmap", [False], indirect=True)
-def test_configmap_present(salt_call_cli, configmap, configmap_template, configmap_present_state):
+def test_configmap_present(salt_call_cli, configmap, configmap_template, present_states):
     """
     Test configmap creation via states
     """
     ret = salt_call_cli.run(
         "state.apply",
-        configmap_present_state,
+        present_states["configmap"],
         pillar={
             "name": configmap["name"],
             "source": configmap_template,
@@ -768,20 +514,13 @@ def test_configmap_present(salt_call_cli, configmap, configmap_template, configm
     assert ret.data["data"]["app.properties"] == "app.name=myapp\napp.port=8080"
 
 
-def test_configmap_absent(salt_call_cli, configmap, configmap_absent_state):
+def test_configmap_absent(salt_call_cli, configmap, absent_states):
     """
     Test configmap deletion via states
     """
-    # Verify configmap exists
-    ret = salt_call_cli.run(
-        "kubernetes.show_configmap", name=configmap["name"], namespace=configmap["namespace"]
-    )
-    assert ret.returncode == 0
-    assert ret.data is not None
-
     # Delete the configmap using the state
     ret = salt_call_cli.run(
-        "state.apply", configmap_absent_state, pillar={"name": configmap["name"]}
+        "state.apply", absent_states["configmap"], pillar={"name": configmap["name"]}
     )
     assert ret.returncode == 0
 
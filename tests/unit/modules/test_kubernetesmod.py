@@ -2,6 +2,7 @@
 :codeauthor: Jochen Breuer <jbreuer@suse.de>
 """
 
+import base64
 import logging
 
 # pylint: disable=no-value-for-parameter
@@ -14,6 +15,7 @@ from kubernetes.client import V1Container
 from kubernetes.client import V1DeploymentSpec
 from kubernetes.client import V1PodSpec
 from kubernetes.client import V1PodTemplateSpec
+from kubernetes.client.rest import ApiException
 from salt.exceptions import CommandExecutionError
 from salt.modules import config
 
@@ -77,6 +79,29 @@ def test_nodes(mock_kubernetes_lib):
     )
     assert kubernetes.nodes() == ["mock_node_name"]
     assert kubernetes.kubernetes.client.CoreV1Api().list_node().to_dict.called
+    kubernetes.kubernetes.client.CoreV1Api().list_node.assert_any_call(resource_version="0")
+
+
+def test_node(mock_kubernetes_lib):
+    """
+    Test node lookup reads the node directly instead of listing all nodes
+    """
+    mock_kubernetes_lib.client.CoreV1Api.return_value = Mock(
+        **{"read_node.return_value.to_dict.return_value": {"metadata": {"name": "minikube"}}}
+    )
+    assert kubernetes.node("minikube") == {"metadata": {"name": "minikube"}}
+    kubernetes.kubernetes.client.CoreV1Api().read_node.assert_called_once_with("minikube")
+    assert not kubernetes.kubernetes.client.CoreV1Api().list_node.called
+
+
+def test_node_not_found(mock_kubernetes_lib):
+    """
+    Test node lookup returns None for a missing node
+    """
+    mock_kubernetes_lib.client.CoreV1Api.return_value = Mock(
+        **{"read_node.side_effect": ApiException(status=404)}
+    )
+    assert kubernetes.node("missing") is None
 
 
 def test_deployments(mock_kubernetes_lib):
@@ -176,6 +201,35 @@ def test_setup_kubeconfig_file(mock_kubernetes_lib):
     assert config.option("kubernetes.kubeconfig") == cfg["kubeconfig"]
 
 
+def test_setup_conn_reuses_api_client(mock_kubernetes_lib, tmp_path):
+    """
+    Test that an unchanged kubeconfig and context reuse the cached API client
+    """
+    kubeconfig = tmp_path / "kubeconfig"
+    kubeconfig.write_text("")
+    with patch.dict(kubernetes._API_CLIENT, clear=True):
+        kubernetes._setup_conn(kubeconfig=str(kubeconfig), context="minikube")
+        kubernetes._setup_conn(kubeconfig=str(kubeconfig), context="minikube")
+        mock_kubernetes_lib.config.load_kube_config.assert_called_once_with(
+            config_file=str(kubeconfig), context="minikube"
+        )
+        assert kubernetes._api_client() is mock_kubernetes_lib.client.ApiClient.return_value
+
+
+def test_setup_conn_reuses_api_client_for_kubeconfig_data(mock_kubernetes_lib):
+    """
+    Test that the same kubeconfig_data and context reuse the cached API client,
+    even though every call writes a new temporary kubeconfig
+    """
+    kubeconfig_data = base64.b64encode(b"kubeconfig").decode()
+    with patch.dict(kubernetes._API_CLIENT, clear=True):
+        for _ in range(2):
+            cfg = kubernetes._setup_conn(kubeconfig_data=kubeconfig_data, context="minikube")
+            kubernetes._cleanup(**cfg)
+        mock_kubernetes_lib.config.load_kube_config.assert_called_once()
+        assert kubernetes._api_client() is mock_kubernetes_lib.client.ApiClient.return_value
+
+
 def test_node_labels():
     """
     Test kubernetes.node_labels
@@ -196,6 +250,76 @@ def test_node_labels():
         }
 
 
+def test_node_remove_labels(mock_kubernetes_lib):
+    """
+    Test kubernetes.node_remove_labels removes all labels with one patch
+    """
+    mock_kubernetes_lib.client.CoreV1Api.return_value = Mock()
+    kubernetes.node_remove_labels("minikube", ["salt.test/label1", "salt.test/label2"])
+    kubernetes.kubernetes.client.CoreV1Api().patch_node.assert_called_once_with(
+        "minikube",
+        {"metadata": {"labels": {"salt.test/label1": None, "salt.test/label2": None}}},
+    )
+
+
+@pytest.mark.parametrize("resource_type", ["secret", "config_map"])
+def test_wait_for_ready_skips_watch_for_stateless_resources(resource_type):
+    """
+    Test that waiting for a secret or configmap to be ready does not open a watch
+    """
+    api_instance = Mock()
+    with patch("saltext.kubernetes.modules.kubernetesmod.Watch") as mock_watch:
+        assert kubernetes._wait_for_resource_status(
+            api_instance, resource_type, "test", "default", "ready", 60
+        )
+        mock_watch.assert_not_called()
+
+
+def test_wait_for_deleted_watches_for_delete_event():
+    """
+    Test that waiting for a deletion follows a watch from the last read resourceVersion
+    """
+    api_instance = Mock(**{"read_namespaced_pod.return_value.metadata.resource_version": "42"})
+    with patch("saltext.kubernetes.modules.kubernetesmod.Watch") as mock_watch:
+        mock_watch.return_value.stream.return_value = iter(
+            [{"type": "MODIFIED", "object": Mock()}, {"type": "DELETED", "object": Mock()}]
+        )
+        assert kubernetes._wait_for_resource_status(
+            api_instance, "pod", "test", "default", "deleted", 60
+        )
+        _, kwargs = mock_watch.return_value.stream.call_args
+        assert kwargs["func"] == api_instance.list_namespaced_pod
+        assert kwargs["namespace"] == "default"
+        assert kwargs["resource_version"] == "42"
+
+
+def test_wait_for_deleted_already_gone():
+    """
+    Test that waiting for a deletion returns without a watch when the resource is gone
+    """
+    api_instance = Mock(
+        **{"read_namespace.side_effect": ApiException(status=404, reason="Not Found")}
+    )
+    with patch("saltext.kubernetes.modules.kubernetesmod.Watch") as mock_watch:
+        assert kubernetes._wait_for_resource_status(
+            api_instance, "namespace", "test", None, "deleted", 60
+        )
+        mock_watch.return_value.stream.assert_not_called()
+
+
+def test_delete_pod_grace_period(mock_kubernetes_lib):
+    """
+    Test that grace_period_seconds is passed through to the delete options
+    """
+    mock_kubernetes_lib.client.CoreV1Api.return_value = Mock(
+        **{"delete_namespaced_pod.return_value.to_dict.return_value": {}}
+    )
+    kubernetes.delete_pod("test-pod", "default", grace_period_seconds=0)
+    mock_kubernetes_lib.client.V1DeleteOptions.assert_called_once_with(
+        orphan_dependents=True, grace_period_seconds=0
+    )
+
+
 def test_adding_change_cause_annotation():
     """
     Tests adding a `kubernetes.io/change-cause` annotation just like
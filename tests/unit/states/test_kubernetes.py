@@ -644,6 +644,33 @@ def test_node_label_absent__delete():
             }
 
 
+def test_node_label_folder_absent__delete():
+    labels = make_node_labels()
+    labels.update({"salt.test/label1": "value1", "salt.test/label2": "value2"})
+
+    with mock_func("node_labels", return_value=labels):
+        with mock_func("node_remove_labels", return_value=make_node()) as mock_remove:
+            actual = kubernetes.node_label_folder_absent(
+                name="salt.test",
+                node="minikube",
+            )
+            mock_remove.assert_called_once_with(
+                node_name="minikube",
+                label_names=["salt.test/label1", "salt.test/label2"],
+            )
+            assert actual == {
+                "result": True,
+                "changes": {
+                    "kubernetes.node_label_folder_absent": {
+                        "old": list(labels),
+                        "new": list(make_node_labels()),
+                    }
+                },
+                "comment": "Label folder removed from node",
+                "name": "salt.test",
+            }
+
+
 def test_namespace_present__create_test_true():
     with mock_func("show_namespace", return_value=None, test=True):
         actual = kubernetes.namespace_present(name="saltstack")